@@ -4,46 +4,172 @@
 Консольное приложение для управления документами и их согласованием
 """
 
-import json
 import os
+import sys
+from contextlib import contextmanager
 from datetime import datetime
-from enum import Enum
-from typing import Dict, List, Optional
+from enum import IntEnum
+from typing import Dict, List, Optional, Set, Tuple
 
+import json_backend
 
-class DocumentStatus(Enum):
+try:
+    import ijson
+except ImportError:  # ijson не установлен - снимок всегда читается целиком
+    ijson = None
+
+# Версия формата файла данных: 2 - история хранится структурированными записями,
+# 3 - история вынесена в отдельные файлы <файл>.history/<id>.jsonl,
+# 4 - статусы хранятся числами DocumentStatus
+DATA_FORMAT_VERSION = 4
+# Журнал сжимается в снимок, когда превышает размер снимка в LOG_COMPACT_RATIO раз
+LOG_COMPACT_RATIO = 10
+LOG_COMPACT_MIN_SIZE = 1024
+# Снимки больше этого размера читаются потоково через ijson (если установлен)
+STREAM_LOAD_MIN_SIZE = 8 << 20
+# При сохранении история длиннее HISTORY_COMPACT_THRESHOLD записей сворачивается:
+# остаются запись о создании и последние HISTORY_KEEP_LAST записей
+HISTORY_COMPACT_THRESHOLD = 100
+HISTORY_KEEP_LAST = 20
+# Размер буфера записи снимка: весь снимок уходит на диск одним вызовом write
+WRITE_BUFFER_SIZE = 1 << 20
+
+
+def _now_str() -> str:
+    """Текущее время в формате ГГГГ-ММ-ДД ЧЧ:ММ:СС (без strftime)"""
+    t = datetime.now()
+    return f"{t.year:04d}-{t.month:02d}-{t.day:02d} {t.hour:02d}:{t.minute:02d}:{t.second:02d}"
+
+
+class DocumentStatus(IntEnum):
     """Статусы документов"""
-    DRAFT = "Черновик"
-    REVIEW = "На рассмотрении"
-    APPROVED = "Согласован"
-    REJECTED = "Отклонен"
-    ARCHIVED = "Архивирован"
+    DRAFT = 1
+    REVIEW = 2
+    APPROVED = 3
+    REJECTED = 4
+    ARCHIVED = 5
+
+
+# Названия статусов для отображения пользователю
+STATUS_LABELS = {
+    DocumentStatus.DRAFT: "Черновик",
+    DocumentStatus.REVIEW: "На рассмотрении",
+    DocumentStatus.APPROVED: "Согласован",
+    DocumentStatus.REJECTED: "Отклонен",
+    DocumentStatus.ARCHIVED: "Архивирован",
+}
+
+
+def _parse_status(value) -> DocumentStatus:
+    """Статус из сохраненного значения: число (версия 4+) или имя (старые версии)"""
+    if isinstance(value, str):
+        return DocumentStatus[value]
+    return DocumentStatus(value)
+
+
+def _history_record(old_status: Optional[DocumentStatus], new_status: DocumentStatus,
+                    comment: str, timestamp: str) -> dict:
+    """Запись истории изменений (old = None для создания документа)"""
+    return {
+        'old': int(old_status) if old_status is not None else None,
+        'new': int(new_status),
+        'comment': comment,
+        'ts': timestamp
+    }
+
+
+def format_history_entry(entry) -> str:
+    """Человекочитаемое представление записи истории"""
+    if isinstance(entry, str):
+        # Запись в старом формате (версия 1) хранится уже отформатированной
+        return entry
+    if 'omitted' in entry:
+        return f"... пропущено изменений статуса: {entry['omitted']} ..."
+    if entry['old'] is None:
+        return f"Документ создан ({entry['ts']})"
+    old_label = STATUS_LABELS[_parse_status(entry['old'])]
+    new_label = STATUS_LABELS[_parse_status(entry['new'])]
+    text = f"Статус изменен с '{old_label}' на '{new_label}'"
+    if entry['comment']:
+        text += f" ({entry['comment']})"
+    return text + f" - {entry['ts']}"
+
+
+def _read_history(history_file: Optional[str]) -> list:
+    """Чтение истории документа из файла JSON Lines"""
+    history = []
+    if history_file and os.path.exists(history_file):
+        with open(history_file, 'rb') as f:
+            for line in f:
+                try:
+                    history.append(json_backend.loads(line))
+                except json_backend.DecodeError:
+                    break
+    return history
 
 
 class Document:
     """Класс для представления документа"""
     
-    def __init__(self, doc_id: int, title: str, description: str = ""):
+    __slots__ = ('id', 'title', 'description', 'status', 'created_at', 'updated_at',
+                 '_history', '_history_file', '_history_len', '_row_cache')
+    
+    def __init__(self, doc_id: int, title: str, description: str = "", history_file: Optional[str] = None):
         self.id = doc_id
         self.title = title
         self.description = description
         self.status = DocumentStatus.DRAFT
-        self.created_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.created_at = _now_str()
         self.updated_at = self.created_at
-        self.history = [f"Документ создан ({self.created_at})"]
+        self._history: Optional[list] = [_history_record(None, self.status, "", self.created_at)]
+        self._history_file = history_file
+        self._history_len: Optional[int] = 1
+        self._row_cache: Optional[str] = None
     
-    def change_status(self, new_status: DocumentStatus, comment: str = ""):
-        """Изменение статуса документа"""
+    @property
+    def history(self) -> list:
+        """История изменений; при первом обращении читается из файла истории"""
+        if self._history is None:
+            self._history = _read_history(self._history_file)
+        return self._history
+    
+    @property
+    def history_len(self) -> int:
+        """Количество записей истории (без чтения файла, если оно сохранено в снимке)"""
+        if self._history_len is None:
+            self._history_len = len(self.history)
+        return self._history_len
+    
+    def compact_history(self, keep_last: int = HISTORY_KEEP_LAST) -> bool:
+        """Свертка истории: остаются запись о создании, сводная запись и последние keep_last записей"""
+        history = self.history
+        if len(history) <= keep_last + 2:
+            return False
+        middle = history[1:len(history) - keep_last]
+        omitted = sum(entry.get('omitted', 1) if isinstance(entry, dict) else 1 for entry in middle)
+        history[1:len(history) - keep_last] = [{'omitted': omitted}]
+        self._history_len = len(history)
+        return True
+    
+    def change_status(self, new_status: DocumentStatus, comment: str = "", timestamp: Optional[str] = None) -> dict:
+        """Изменение статуса документа; возвращает добавленную запись истории"""
         old_status = self.status
         self.status = new_status
-        self.updated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        
-        history_entry = f"Статус изменен с '{old_status.value}' на '{new_status.value}'"
-        if comment:
-            history_entry += f" ({comment})"
-        history_entry += f" - {self.updated_at}"
-        
-        self.history.append(history_entry)
+        self.updated_at = timestamp or _now_str()
+        self._row_cache = None
+        if self._history_len is not None:
+            self._history_len += 1
+        record = _history_record(old_status, new_status, comment, self.updated_at)
+        # Незагруженную историю не читаем: запись дописывается в файл менеджером
+        if self._history is not None:
+            self._history.append(record)
+        return record
+    
+    def table_row(self) -> str:
+        """Строка таблицы документов (кэшируется до следующего изменения статуса)"""
+        if self._row_cache is None:
+            self._row_cache = f"{self.id:<4} {self.title[:28]:<30} {STATUS_LABELS[self.status]:<15} {self.updated_at:<20}"
+        return self._row_cache
     
     def to_dict(self) -> dict:
         """Преобразование объекта в словарь для сохранения"""
@@ -51,60 +177,229 @@ class Document:
             'id': self.id,
             'title': self.title,
             'description': self.description,
-            'status': self.status.name,
+            'status': int(self.status),
             'created_at': self.created_at,
             'updated_at': self.updated_at,
-            'history': self.history
+            'history_len': self._history_len
         }
     
     @classmethod
-    def from_dict(cls, data: dict):
-        """Создание объекта из словаря"""
-        doc = cls(data['id'], data['title'], data['description'])
-        doc.status = DocumentStatus[data['status']]
+    def from_dict(cls, data: dict, history_file: Optional[str] = None):
+        """Создание объекта из словаря (история загружается лениво из history_file)"""
+        # __init__ не вызывается: все поля берутся из словаря
+        doc = cls.__new__(cls)
+        doc.id = data['id']
+        doc.title = data['title']
+        doc.description = data['description']
+        doc.status = _parse_status(data['status'])
         doc.created_at = data['created_at']
         doc.updated_at = data['updated_at']
-        doc.history = data['history']
+        # Формат версии 2 и ниже хранил историю прямо в словаре
+        doc._history = data.get('history')
+        doc._history_file = history_file
+        doc._history_len = data.get('history_len')
+        if doc._history_len is None and doc._history is not None:
+            doc._history_len = len(doc._history)
+        doc._row_cache = None
         return doc
 
 
 class DocumentManager:
     """Менеджер для управления документами"""
     
-    def __init__(self, data_file: str = "documents.json"):
+    def __init__(self, data_file: str = "documents.json",
+                 history_threshold: Optional[int] = HISTORY_COMPACT_THRESHOLD,
+                 history_keep_last: int = HISTORY_KEEP_LAST):
         self.data_file = data_file
+        # history_threshold = None отключает свертку истории
+        self.history_threshold = history_threshold
+        self.history_keep_last = history_keep_last
+        self.log_file = data_file + ".log"
+        self.history_dir = data_file + ".history"
         self.documents: Dict[int, Document] = {}
+        self._by_status: Dict[DocumentStatus, Set[int]] = {status: set() for status in DocumentStatus}
         self.next_id = 1
+        self._snapshot_size = 0
+        self._log_size = 0
+        self._dirty = False
+        self._batch_depth = 0
+        self._legacy_history: Set[int] = set()
+        # Версия данных увеличивается при каждом изменении и инвалидирует кэш поиска
+        self._version = 0
+        self._search_cache: Dict[DocumentStatus, Tuple[int, tuple]] = {}
         self.load_documents()
     
     def load_documents(self):
-        """Загрузка документов из файла"""
+        """Загрузка документов из файла и воспроизведение журнала изменений"""
         if os.path.exists(self.data_file):
             try:
-                with open(self.data_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                self._snapshot_size = os.path.getsize(self.data_file)
+                if ijson is not None and self._snapshot_size >= STREAM_LOAD_MIN_SIZE:
+                    self._load_snapshot_stream()
+                else:
+                    with open(self.data_file, 'rb') as f:
+                        data = json_backend.loads(f.read())
                     for doc_data in data.get('documents', []):
-                        doc = Document.from_dict(doc_data)
-                        self.documents[doc.id] = doc
+                        self._load_document(doc_data)
                     self.next_id = data.get('next_id', 1)
-            except (json.JSONDecodeError, FileNotFoundError):
+            except (json_backend.DecodeError, FileNotFoundError):
                 pass
+        self._replay_log()
+        self._rebuild_status_index()
+        if self._legacy_history:
+            self._migrate_history()
+    
+    def _load_snapshot_stream(self):
+        """Потоковая загрузка снимка: документы создаются по одному, без разбора всего файла в память"""
+        try:
+            with open(self.data_file, 'rb') as f:
+                # next_id записывается в начале снимка, поэтому первый проход короткий
+                self.next_id = next(ijson.items(f, 'next_id'), 1)
+                f.seek(0)
+                for doc_data in ijson.items(f, 'documents.item'):
+                    self._load_document(doc_data)
+        except ijson.JSONError as e:
+            raise json_backend.DecodeError(str(e)) from e
+    
+    def _load_document(self, doc_data: dict) -> Document:
+        """Создание загруженного документа с привязкой к файлу истории"""
+        doc = Document.from_dict(doc_data, self._history_path(doc_data['id']))
+        self.documents[doc.id] = doc
+        if 'history' in doc_data:
+            self._legacy_history.add(doc.id)
+        return doc
+    
+    def _migrate_history(self):
+        """Перенос встроенной истории старого формата в отдельные файлы"""
+        for doc_id in self._legacy_history:
+            self._write_history(self.documents[doc_id])
+        self._legacy_history.clear()
+        self.save_documents()
     
-    def save_documents(self):
-        """Сохранение документов в файл"""
+    def _history_path(self, doc_id: int) -> str:
+        """Путь к файлу истории документа"""
+        return os.path.join(self.history_dir, f"{doc_id}.jsonl")
+    
+    def _write_history(self, doc: Document):
+        """Полная перезапись файла истории документа"""
+        os.makedirs(self.history_dir, exist_ok=True)
+        history_file = self._history_path(doc.id)
+        tmp_file = history_file + ".tmp"
+        with open(tmp_file, 'wb') as f:
+            f.write(b"".join(json_backend.dumps(entry) + b"\n" for entry in doc.history))
+        os.replace(tmp_file, history_file)
+    
+    def _compact_histories(self):
+        """Свертка слишком длинных историй документов"""
+        if self.history_threshold is None:
+            return
+        for doc in self.documents.values():
+            if doc.history_len > self.history_threshold and doc.compact_history(self.history_keep_last):
+                self._write_history(doc)
+    
+    def _append_history(self, doc_id: int, record: dict):
+        """Дописывание записи в файл истории документа"""
+        os.makedirs(self.history_dir, exist_ok=True)
+        with open(self._history_path(doc_id), 'ab') as f:
+            f.write(json_backend.dumps(record) + b"\n")
+    
+    def _rebuild_status_index(self):
+        """Перестроение индекса документов по статусам"""
+        for ids in self._by_status.values():
+            ids.clear()
+        for doc in self.documents.values():
+            self._by_status[doc.status].add(doc.id)
+    
+    def _replay_log(self):
+        """Применение операций из журнала поверх снимка"""
+        if not os.path.exists(self.log_file):
+            return
+        with open(self.log_file, 'rb') as f:
+            for line in f:
+                try:
+                    record = json_backend.loads(line)
+                except json_backend.DecodeError:
+                    # Незавершенная запись (например, после сбоя) - дальше не читаем
+                    break
+                self._apply_log_record(record)
+                self._log_size += len(line)
+    
+    def _apply_log_record(self, record: dict):
+        """Применение одной операции журнала"""
+        if record['op'] == 'add':
+            doc = self._load_document(record['doc'])
+            self.next_id = max(self.next_id, doc.id + 1)
+        elif record['op'] == 'status':
+            doc = self.documents.get(record['id'])
+            if doc:
+                doc.change_status(_parse_status(record['status']), record['comment'], record['ts'])
+    
+    def _append_log(self, record: dict):
+        """Дописывание операции в конец журнала"""
+        if self._batch_depth:
+            self._dirty = True
+            return
+        line = json_backend.dumps(record) + b"\n"
+        with open(self.log_file, 'ab') as f:
+            f.write(line)
+        self._log_size += len(line)
+        self.compact()
+    
+    def save_documents(self, sync: bool = False):
+        """Сохранение полного снимка документов в файл и очистка журнала"""
+        if self._batch_depth:
+            self._dirty = True
+            return
+        self._compact_histories()
         data = {
-            'documents': [doc.to_dict() for doc in self.documents.values()],
-            'next_id': self.next_id
+            'version': DATA_FORMAT_VERSION,
+            'next_id': self.next_id,
+            'documents': [doc.to_dict() for doc in self.documents.values()]
         }
-        with open(self.data_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        payload = json_backend.dumps(data, indent=True)
+        # Запись во временный файл и атомарная замена: при сбое старый снимок остается целым
+        tmp_file = self.data_file + ".tmp"
+        with open(tmp_file, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            f.write(payload)
+            if sync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_file, self.data_file)
+        self._snapshot_size = len(payload)
+        if os.path.exists(self.log_file):
+            os.remove(self.log_file)
+        self._log_size = 0
+    
+    def checkpoint(self):
+        """Сохранение снимка с гарантированной записью на диск"""
+        self.save_documents(sync=True)
+    
+    @contextmanager
+    def batch(self):
+        """Группировка изменений: данные сохраняются один раз при выходе из блока"""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._dirty:
+                self._dirty = False
+                self.save_documents()
+    
+    def compact(self, force: bool = False):
+        """Перезапись снимка, если журнал стал слишком большим"""
+        if force or self._log_size > LOG_COMPACT_RATIO * max(self._snapshot_size, LOG_COMPACT_MIN_SIZE):
+            self.save_documents()
     
     def add_document(self, title: str, description: str = "") -> Document:
         """Добавление нового документа"""
-        doc = Document(self.next_id, title, description)
+        doc = Document(self.next_id, title, description, self._history_path(self.next_id))
         self.documents[self.next_id] = doc
+        self._write_history(doc)
         self.next_id += 1
-        self.save_documents()
+        self._by_status[doc.status].add(doc.id)
+        self._version += 1
+        self._append_log({'op': 'add', 'doc': doc.to_dict()})
         return doc
     
     def get_document(self, doc_id: int) -> Optional[Document]:
@@ -112,19 +407,63 @@ class DocumentManager:
         return self.documents.get(doc_id)
     
     def get_all_documents(self) -> List[Document]:
-        """Получение всех документов"""
+        """Получение всех документов (по возрастанию ID - порядок вставки)"""
         return list(self.documents.values())
     
+    def search_by_status(self, status: DocumentStatus) -> List[Document]:
+        """Получение документов с указанным статусом (по возрастанию ID)"""
+        return [self.documents[doc_id] for doc_id in sorted(self._by_status[status])]
+    
+    def search_rows_by_status(self, status: DocumentStatus) -> Tuple[Tuple[int, str, str], ...]:
+        """Кортежи (id, название, дата обновления) документов с указанным статусом.
+        
+        Результат кэшируется до следующего изменения документов.
+        """
+        cached = self._search_cache.get(status)
+        if cached is not None and cached[0] == self._version:
+            return cached[1]
+        rows = tuple((doc.id, doc.title, doc.updated_at) for doc in self.search_by_status(status))
+        self._search_cache[status] = (self._version, rows)
+        return rows
+    
     def change_document_status(self, doc_id: int, new_status: DocumentStatus, comment: str = "") -> bool:
         """Изменение статуса документа"""
         doc = self.get_document(doc_id)
         if doc:
-            doc.change_status(new_status, comment)
-            self.save_documents()
+            self._by_status[doc.status].discard(doc_id)
+            self._append_history(doc_id, doc.change_status(new_status, comment))
+            self._by_status[new_status].add(doc_id)
+            self._version += 1
+            self._append_log({
+                'op': 'status',
+                'id': doc_id,
+                'status': int(new_status),
+                'comment': comment,
+                'ts': doc.updated_at
+            })
             return True
         return False
 
 
+# Тексты меню и список статусов собираются один раз при импорте модуля
+_STATUSES: Tuple[DocumentStatus, ...] = tuple(DocumentStatus)
+
+_MENU = "\n".join([
+    "\n" + "=" * 50,
+    "СИСТЕМА УПРАВЛЕНИЯ ДОКУМЕНТАМИ",
+    "=" * 50,
+    "1. Добавить документ",
+    "2. Показать все документы",
+    "3. Изменить статус документа",
+    "4. Показать историю документа",
+    "5. Поиск документов по статусу",
+    "0. Выход",
+    "-" * 50
+]) + "\n"
+
+_STATUS_MENU = "".join(f"{i}. {STATUS_LABELS[status]}\n" for i, status in enumerate(_STATUSES, 1))
+
+
 class DocumentWorkflowApp:
     """Главный класс консольного приложения"""
     
@@ -133,16 +472,7 @@ class DocumentWorkflowApp:
     
     def display_menu(self):
         """Отображение главного меню"""
-        print("\n" + "="*50)
-        print("СИСТЕМА УПРАВЛЕНИЯ ДОКУМЕНТАМИ")
-        print("="*50)
-        print("1. Добавить документ")
-        print("2. Показать все документы")
-        print("3. Изменить статус документа")
-        print("4. Показать историю документа")
-        print("5. Поиск документов по статусу")
-        print("0. Выход")
-        print("-"*50)
+        sys.stdout.write(_MENU)
     
     def add_document(self):
         """Добавление нового документа"""
@@ -165,12 +495,15 @@ class DocumentWorkflowApp:
             print("\nДокументы не найдены.")
             return
         
-        print(f"\n--- СПИСОК ДОКУМЕНТОВ ({len(documents)} шт.) ---")
-        print(f"{'ID':<4} {'Название':<30} {'Статус':<15} {'Обновлен':<20}")
-        print("-" * 75)
-        
-        for doc in sorted(documents, key=lambda x: x.id):
-            print(f"{doc.id:<4} {doc.title[:28]:<30} {doc.status.value:<15} {doc.updated_at:<20}")
+        # Таблица собирается целиком и выводится одним вызовом write
+        lines = [
+            f"\n--- СПИСОК ДОКУМЕНТОВ ({len(documents)} шт.) ---",
+            f"{'ID':<4} {'Название':<30} {'Статус':<15} {'Обновлен':<20}",
+            "-" * 75
+        ]
+        for doc in documents:
+            lines.append(doc.table_row())
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def change_document_status(self):
         """Изменение статуса документа"""
@@ -192,13 +525,12 @@ class DocumentWorkflowApp:
             return
         
         print(f"\nТекущий документ: '{doc.title}'")
-        print(f"Текущий статус: {doc.status.value}")
+        print(f"Текущий статус: {STATUS_LABELS[doc.status]}")
         
         # Показ доступных статусов
         print("\nДоступные статусы:")
-        statuses = list(DocumentStatus)
-        for i, status in enumerate(statuses, 1):
-            print(f"{i}. {status.value}")
+        statuses = _STATUSES
+        sys.stdout.write(_STATUS_MENU)
         
         try:
             choice = int(input("\nВыберите новый статус (номер): "))
@@ -207,7 +539,7 @@ class DocumentWorkflowApp:
                 comment = input("Добавить комментарий (необязательно): ").strip()
                 
                 self.manager.change_document_status(doc_id, new_status, comment)
-                print(f"✓ Статус документа изменен на '{new_status.value}'")
+                print(f"✓ Статус документа изменен на '{STATUS_LABELS[new_status]}'")
             else:
                 print("Ошибка: Некорректный выбор!")
         except ValueError:
@@ -232,41 +564,43 @@ class DocumentWorkflowApp:
             print(f"Ошибка: Документ с ID {doc_id} не найден!")
             return
         
-        print(f"\nИстория документа '{doc.title}' (ID: {doc.id})")
-        print("Описание:", doc.description or "Отсутствует")
-        print("Текущий статус:", doc.status.value)
-        print("\nИстория изменений:")
-        print("-" * 60)
-        
+        lines = [
+            f"\nИстория документа '{doc.title}' (ID: {doc.id})",
+            f"Описание: {doc.description or 'Отсутствует'}",
+            f"Текущий статус: {STATUS_LABELS[doc.status]}",
+            "\nИстория изменений:",
+            "-" * 60
+        ]
         for i, entry in enumerate(doc.history, 1):
-            print(f"{i}. {entry}")
+            lines.append(f"{i}. {format_history_entry(entry)}")
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def search_documents_by_status(self):
         """Поиск документов по статусу"""
         print("\n--- ПОИСК ПО СТАТУСУ ---")
         print("Доступные статусы:")
-        statuses = list(DocumentStatus)
-        for i, status in enumerate(statuses, 1):
-            print(f"{i}. {status.value}")
+        statuses = _STATUSES
+        sys.stdout.write(_STATUS_MENU)
         
         try:
             choice = int(input("\nВыберите статус (номер): "))
             if 1 <= choice <= len(statuses):
                 selected_status = statuses[choice - 1]
                 
-                filtered_docs = [doc for doc in self.manager.get_all_documents() 
-                               if doc.status == selected_status]
+                filtered_rows = self.manager.search_rows_by_status(selected_status)
                 
-                if not filtered_docs:
-                    print(f"\nДокументы со статусом '{selected_status.value}' не найдены.")
+                if not filtered_rows:
+                    print(f"\nДокументы со статусом '{STATUS_LABELS[selected_status]}' не найдены.")
                     return
                 
-                print(f"\n--- ДОКУМЕНТЫ СО СТАТУСОМ '{selected_status.value}' ({len(filtered_docs)} шт.) ---")
-                print(f"{'ID':<4} {'Название':<30} {'Обновлен':<20}")
-                print("-" * 60)
-                
-                for doc in sorted(filtered_docs, key=lambda x: x.id):
-                    print(f"{doc.id:<4} {doc.title[:28]:<30} {doc.updated_at:<20}")
+                lines = [
+                    f"\n--- ДОКУМЕНТЫ СО СТАТУСОМ '{STATUS_LABELS[selected_status]}' ({len(filtered_rows)} шт.) ---",
+                    f"{'ID':<4} {'Название':<30} {'Обновлен':<20}",
+                    "-" * 60
+                ]
+                for doc_id, title, updated_at in filtered_rows:
+                    lines.append(f"{doc_id:<4} {title[:28]:<30} {updated_at:<20}")
+                sys.stdout.write("\n".join(lines) + "\n")
             else:
                 print("Ошибка: Некорректный выбор!")
         except ValueError:
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Выбор JSON-библиотеки для сохранения документов: orjson, ujson или стандартный json
+"""
+
+import json
+import os
+
+# Переменная окружения для явного выбора библиотеки (orjson, ujson или json)
+BACKEND_ENV_VAR = "DOCUMENT_WORKFLOW_JSON"
+BACKENDS = ("orjson", "ujson", "json")
+
+# Все библиотеки сообщают об ошибке разбора исключением-наследником ValueError
+DecodeError = ValueError
+
+
+def _orjson_backend():
+    import orjson
+
+    def dumps(data, indent: bool = False) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+
+    return dumps, orjson.loads
+
+
+def _ujson_backend():
+    import ujson
+
+    def dumps(data, indent: bool = False) -> bytes:
+        return ujson.dumps(data, ensure_ascii=False, indent=2 if indent else 0).encode('utf-8')
+
+    return dumps, ujson.loads
+
+
+def _json_backend():
+    def dumps(data, indent: bool = False) -> bytes:
+        if indent:
+            return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+        return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+    return dumps, json.loads
+
+
+_FACTORIES = {
+    "orjson": _orjson_backend,
+    "ujson": _ujson_backend,
+    "json": _json_backend,
+}
+
+
+def _select_json_backend(name: str = ""):
+    """Выбор библиотеки: заданной явно или первой доступной из BACKENDS"""
+    if name:
+        if name not in _FACTORIES:
+            raise ValueError(f"Неизвестная JSON-библиотека '{name}', допустимые: {', '.join(BACKENDS)}")
+        return (name,) + _FACTORIES[name]()
+    for candidate in BACKENDS:
+        try:
+            return (candidate,) + _FACTORIES[candidate]()
+        except ImportError:
+            continue
+    raise ImportError("Не найдена ни одна JSON-библиотека")
+
+
+BACKEND, dumps, loads = _select_json_backend(os.environ.get(BACKEND_ENV_VAR, ""))